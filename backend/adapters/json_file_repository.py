@@ -5,13 +5,19 @@ Implements the StepRepository port interface using JSON files as the data source
 
 import json
 import logging
-from glob import glob
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import orjson
+
 from domain.step import Step
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent file reads during a full folder load
+_MAX_READ_WORKERS = 32
+
 
 class JsonFileRepository:
     """Repository adapter that reads Step data from JSON files.
@@ -40,26 +46,29 @@ class JsonFileRepository:
         """Retrieve all steps from JSON files in the folder.
 
         Reads all *.json files in the configured folder and parses them
-        into Step objects. Malformed JSON files are skipped with a warning.
+        into Step objects. Files are read concurrently on a thread pool so
+        that per-file I/O latency overlaps. Malformed JSON files are skipped
+        with a warning.
 
         Returns:
             List of all Step objects parsed from JSON files.
             Returns empty list if no valid steps are found.
         """
-        steps: list[Step] = []
-        pattern = str(self._folder_path / "*.json")
+        paths = self._list_step_files()
+        if not paths:
+            return []
 
-        for file_path in glob(pattern):
-            step = self._read_step_file(file_path)
-            if step is not None:
-                steps.append(step)
+        max_workers = min(_MAX_READ_WORKERS, len(paths))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(self._read_step_file, paths))
 
-        return steps
+        return [step for step in results if step is not None]
 
     def get_by_id(self, task_id: str) -> Step | None:
         """Retrieve a step by its task_id.
 
-        Searches through all JSON files to find the step with the matching task_id.
+        Step files are named after their task_id (e.g., '01-02.json'), so only
+        the matching file is read rather than the whole folder.
 
         Args:
             task_id: The unique identifier for the task (e.g., '01-02')
@@ -67,10 +76,20 @@ class JsonFileRepository:
         Returns:
             The Step with the matching task_id, or None if not found.
         """
-        for step in self.get_all():
-            if step.task_id == task_id:
-                return step
-        return None
+        file_path = self._step_file_path(task_id)
+        if not file_path.is_file():
+            return None
+
+        step = self._read_step_file(str(file_path))
+        if step is not None and step.task_id != task_id:
+            logger.debug(
+                "Step file '%s' declares task_id '%s', expected '%s'",
+                file_path,
+                step.task_id,
+                task_id,
+            )
+            return None
+        return step
 
     def refresh(self, task_id: str) -> Step | None:
         """Re-read and return the step data for a specific task.
@@ -83,23 +102,70 @@ class JsonFileRepository:
         Returns:
             The refreshed Step with the matching task_id, or None if not found.
         """
-        # Re-read all files to get fresh data
         return self.get_by_id(task_id)
 
+    def _list_step_files(self) -> list[str]:
+        """List the JSON files in the configured folder.
+
+        Uses a single os.scandir pass rather than glob, so no pattern has to be
+        compiled and matched per entry. Hidden files are skipped, as glob's
+        '*' would skip them.
+
+        Returns:
+            Paths of all *.json files directly inside the folder.
+            Returns empty list if the folder does not exist.
+        """
+        try:
+            with os.scandir(self._folder_path) as entries:
+                return [
+                    entry.path
+                    for entry in entries
+                    if entry.name.endswith(".json")
+                    and not entry.name.startswith(".")
+                    and entry.is_file()
+                ]
+        except FileNotFoundError:
+            logger.warning("Steps folder not found: %s", self._folder_path)
+            return []
+
+    def _step_file_path(self, task_id: str) -> Path:
+        """Return the path of the JSON file holding the given task_id.
+
+        Args:
+            task_id: The unique identifier for the task (e.g., '01-02')
+
+        Returns:
+            Path to the step file inside the configured folder.
+        """
+        return self._folder_path / f"{task_id}.json"
+
     def _read_step_file(self, file_path: str) -> Step | None:
         """Read and parse a single JSON step file.
 
+        Holds no shared state, so it is safe to call from worker threads.
+
         Args:
             file_path: Path to the JSON file to read.
 
         Returns:
-            Parsed Step object, or None if the file is malformed.
+            Parsed Step object, or None if the file is malformed or
+            could not be read.
         """
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = self._load_json(file_path)
             return Step.from_dict(data)
-        except json.JSONDecodeError as e:
+        except FileNotFoundError:
+            # Removed between the event (or directory listing) and the read
+            logger.debug("Step file disappeared before it was read: %s", file_path)
+            return None
+        except OSError as e:
+            logger.warning(
+                "Skipping unreadable step file '%s': %s",
+                file_path,
+                str(e),
+            )
+            return None
+        except (orjson.JSONDecodeError, json.JSONDecodeError) as e:
             logger.warning(
                 "Skipping malformed JSON file '%s': %s",
                 file_path,
@@ -113,3 +179,23 @@ class JsonFileRepository:
                 str(e),
             )
             return None
+
+    @staticmethod
+    def _load_json(file_path: str) -> object:
+        """Decode the JSON content of a file.
+
+        The file is read in one call rather than memory-mapped: writers may
+        truncate a file in place while it is being read, which only yields a
+        decode error here but would raise SIGBUS on a mapped page.
+
+        Args:
+            file_path: Path to the JSON file to read.
+
+        Returns:
+            The decoded JSON value.
+
+        Raises:
+            orjson.JSONDecodeError: If the content is not valid JSON.
+        """
+        with open(file_path, "rb") as f:
+            return orjson.loads(f.read())
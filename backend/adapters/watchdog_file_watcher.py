@@ -4,46 +4,74 @@ Implements the FileWatcher port interface using the watchdog library
 to monitor a folder for JSON file changes.
 """
 
+import asyncio
 import logging
+import os
 from pathlib import Path
-from threading import Timer
 from typing import Callable
 
 from watchdog.events import FileSystemEvent, FileSystemEventHandler
+from watchdog.observers import Observer
+from watchdog.observers.api import BaseObserver, ObservedWatch
 from watchdog.observers.polling import PollingObserver
 
 from domain.events import FileEvent, FileEventType
+from ports.file_watcher import FileEventBatchCallback
 
 logger = logging.getLogger(__name__)
 
+# Suffixes accepted as step files; a tuple lets str.endswith test them in one call
+_JSON_SUFFIXES = (".json", ".JSON")
+
+# Event type kept when a path sees a second event in the same window; pairs not
+# listed keep the latest. A file created and then written is still new, and a
+# file deleted and then recreated (e.g. write-then-rename) was only modified.
+_MERGED_EVENT_TYPES: dict[tuple[FileEventType, FileEventType], FileEventType] = {
+    (FileEventType.CREATED, FileEventType.MODIFIED): FileEventType.CREATED,
+    (FileEventType.DELETED, FileEventType.CREATED): FileEventType.MODIFIED,
+}
+
 
 class _DebouncedEventHandler(FileSystemEventHandler):
-    """Internal event handler that debounces rapid file changes.
+    """Internal event handler that debounces and coalesces rapid file changes.
 
     Implements debouncing to avoid firing multiple events for rapid
     successive changes to the same file (e.g., during a save operation
-    that triggers multiple write events).
+    that triggers multiple write events), and coalesces changes to many
+    files into a single batch.
+
+    The first event opens a window of debounce_delay seconds; every event
+    arriving before the window closes joins it, collapsing to one event per
+    path (see _MERGED_EVENT_TYPES). When the window closes, one callback receives the whole
+    batch. A single timer handle on an asyncio event loop drives this: the
+    observer thread only hands events over with call_soon_threadsafe, and the
+    batch state is touched only on the loop's thread.
 
     Attributes:
-        callback: The callback to invoke with debounced FileEvents.
-        debounce_delay: Time in seconds to wait before firing the callback.
+        callback: The callback to invoke with each batch of FileEvents.
+        debounce_delay: Length in seconds of the coalescing window.
     """
 
     def __init__(
         self,
-        callback: Callable[[FileEvent], None],
+        callback: FileEventBatchCallback,
+        loop: asyncio.AbstractEventLoop,
         debounce_delay: float = 0.1,
     ) -> None:
         """Initialize the debounced event handler.
 
         Args:
-            callback: Function to call when a debounced file change is detected.
-            debounce_delay: Time in seconds to wait before firing (default 0.1s).
+            callback: Function to call with each batch of file changes.
+            loop: Event loop that runs the flush timer and the callback.
+            debounce_delay: Length of the coalescing window (default 0.1s).
         """
         super().__init__()
         self._callback = callback
+        self._loop = loop
         self._debounce_delay = debounce_delay
-        self._pending_timers: dict[str, Timer] = {}
+        self._pending_paths: dict[str, FileEventType] = {}
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._cancelled = False
 
     def _is_json_file(self, path: str) -> bool:
         """Check if the file path is a JSON file.
@@ -54,39 +82,57 @@ class _DebouncedEventHandler(FileSystemEventHandler):
         Returns:
             True if the file has a .json extension, False otherwise.
         """
-        return Path(path).suffix.lower() == ".json"
+        return path.endswith(_JSON_SUFFIXES)
+
+    def _schedule_callback(self, file_path: str, event_type: FileEventType) -> None:
+        """Schedule a debounced callback for the given file event.
 
-    def _cancel_pending_timer(self, file_path: str) -> None:
-        """Cancel any pending timer for the given file path.
+        Called on the observer thread. Hands the event over to the event loop,
+        where it joins the current batch.
 
         Args:
-            file_path: The file path whose timer should be cancelled.
+            file_path: The path of the changed file.
+            event_type: The type of file event.
         """
-        if file_path in self._pending_timers:
-            self._pending_timers[file_path].cancel()
-            del self._pending_timers[file_path]
+        try:
+            self._loop.call_soon_threadsafe(self._add_to_batch, file_path, event_type)
+        except RuntimeError:
+            logger.debug("Event loop closed, dropping event for %s", file_path)
 
-    def _schedule_callback(self, file_path: str, event_type: FileEventType) -> None:
-        """Schedule a debounced callback for the given file event.
+    def _add_to_batch(self, file_path: str, event_type: FileEventType) -> None:
+        """Record an event in the current batch, opening a window if needed.
 
-        Cancels any pending callback for the same file and schedules a new one.
+        Runs on the event loop's thread.
 
         Args:
             file_path: The path of the changed file.
             event_type: The type of file event.
         """
-        self._cancel_pending_timer(file_path)
+        if self._cancelled:
+            return
 
-        def fire_callback() -> None:
-            if file_path in self._pending_timers:
-                del self._pending_timers[file_path]
-            file_event = FileEvent(event_type=event_type, file_path=file_path)
-            logger.debug("Firing debounced callback for %s", file_event)
-            self._callback(file_event)
+        previous = self._pending_paths.get(file_path)
+        if previous is not None:
+            event_type = _MERGED_EVENT_TYPES.get((previous, event_type), event_type)
+        self._pending_paths[file_path] = event_type
+        if self._flush_handle is None:
+            self._flush_handle = self._loop.call_later(
+                self._debounce_delay, self._flush_batch
+            )
+
+    def _flush_batch(self) -> None:
+        """Invoke the callback with every event collected in the window."""
+        self._flush_handle = None
+        pending, self._pending_paths = self._pending_paths, {}
+        if not pending:
+            return
 
-        timer = Timer(self._debounce_delay, fire_callback)
-        self._pending_timers[file_path] = timer
-        timer.start()
+        file_events = [
+            FileEvent(event_type=event_type, file_path=file_path)
+            for file_path, event_type in pending.items()
+        ]
+        logger.debug("Firing debounced callback for %d events", len(file_events))
+        self._callback(file_events)
 
     def on_created(self, event: FileSystemEvent) -> None:
         """Handle file creation events.
@@ -131,48 +177,146 @@ class _DebouncedEventHandler(FileSystemEventHandler):
         logger.debug("File deleted: %s", event.src_path)
         self._schedule_callback(event.src_path, FileEventType.DELETED)
 
+    def on_moved(self, event: FileSystemEvent) -> None:
+        """Handle file move events.
+
+        Writers that save atomically (write a temporary file, then rename it
+        over the target) produce a move rather than a modification. A JSON
+        source path is reported as deleted and a JSON destination as modified.
+
+        Args:
+            event: The file system event from watchdog.
+        """
+        if event.is_directory:
+            return
+
+        if self._is_json_file(event.src_path):
+            logger.debug("File moved away: %s", event.src_path)
+            self._schedule_callback(event.src_path, FileEventType.DELETED)
+
+        if self._is_json_file(event.dest_path):
+            logger.info("File replaced: %s", event.dest_path)
+            self._schedule_callback(event.dest_path, FileEventType.MODIFIED)
+
     def cancel_all_pending(self) -> None:
-        """Cancel all pending debounce timers.
+        """Cancel the pending flush and discard the current batch.
 
-        Should be called when stopping the watcher to clean up resources.
+        Should be called on the event loop's thread when stopping the watcher
+        to clean up resources. Events still in flight from the observer thread
+        are dropped.
         """
-        for timer in list(self._pending_timers.values()):
-            timer.cancel()
-        self._pending_timers.clear()
+        self._cancelled = True
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._pending_paths.clear()
+
+
+class _FolderLifecycleHandler(FileSystemEventHandler):
+    """Internal handler that tracks removal and recreation of the watched folder.
+
+    Scheduled on the folder's parent directory. A native watch is bound to the
+    folder's inode, so once the folder is deleted (or moved away) it stops
+    delivering events, even if a folder with the same name appears later.
+    This handler reports both transitions so the watch can be re-armed.
+    """
+
+    def __init__(
+        self,
+        folder_path: str,
+        on_removed: Callable[[], None],
+        on_recreated: Callable[[], None],
+    ) -> None:
+        """Initialize the folder lifecycle handler.
+
+        Args:
+            folder_path: Absolute path of the watched folder.
+            on_removed: Called on the observer thread when the folder goes away.
+            on_recreated: Called on the observer thread when it comes back.
+        """
+        super().__init__()
+        self._folder_path = folder_path
+        self._on_removed = on_removed
+        self._on_recreated = on_recreated
+
+    def on_created(self, event: FileSystemEvent) -> None:
+        """Handle directory creation events in the parent directory."""
+        if event.is_directory and event.src_path == self._folder_path:
+            self._on_recreated()
+
+    def on_deleted(self, event: FileSystemEvent) -> None:
+        """Handle directory deletion events in the parent directory."""
+        if event.is_directory and event.src_path == self._folder_path:
+            self._on_removed()
+
+    def on_moved(self, event: FileSystemEvent) -> None:
+        """Handle directory moves into or out of the parent directory."""
+        if not event.is_directory:
+            return
+        if event.src_path == self._folder_path:
+            self._on_removed()
+        if event.dest_path == self._folder_path:
+            self._on_recreated()
 
 
 class WatchdogFileWatcher:
     """File watcher adapter using the watchdog library.
 
-    Monitors a folder for JSON file changes with debouncing support.
+    Monitors a folder for JSON file changes with debouncing and batching.
     Implements the FileWatcher protocol for integration with the domain.
 
+    Uses the platform's native notification API (inotify, FSEvents or
+    ReadDirectoryChangesW) by default. Polling is available as a fallback
+    for file systems that do not deliver native events, such as network
+    shares.
+
+    A native watch does not survive the folder being deleted and recreated,
+    so with native events the parent directory is watched too: when the
+    folder reappears, its watch is re-armed and the JSON files already in it
+    are reported as modified.
+
     Attributes:
         folder_path: Path to the folder being monitored.
-        debounce_delay: Time in seconds to wait before firing events.
+        debounce_delay: Length in seconds of the event coalescing window.
+        use_polling: Whether the folder is polled instead of using native events.
     """
 
     def __init__(
         self,
         folder_path: str | Path,
         debounce_delay: float = 0.1,
+        use_polling: bool = False,
+        loop: asyncio.AbstractEventLoop | None = None,
     ) -> None:
         """Initialize the file watcher.
 
         Args:
             folder_path: Path to the folder to monitor for JSON file changes.
-            debounce_delay: Time in seconds to debounce rapid changes (default 0.1s).
+            debounce_delay: Time in seconds over which changes are coalesced
+                into one batch (default 0.1s).
+            use_polling: Poll the folder once per second instead of relying on
+                native file system events (default False).
+            loop: Event loop that runs debounce timers and callbacks. Defaults
+                to the loop running when start() is called.
         """
         self._folder_path = Path(folder_path)
         self._debounce_delay = debounce_delay
-        self._observer: PollingObserver | None = None
+        self._use_polling = use_polling
+        self._loop = loop
+        self._observer: BaseObserver | None = None
         self._handler: _DebouncedEventHandler | None = None
+        self._watch: ObservedWatch | None = None
 
     @property
     def folder_path(self) -> Path:
         """Return the folder path being monitored."""
         return self._folder_path
 
+    @property
+    def use_polling(self) -> bool:
+        """Return whether the folder is polled instead of using native events."""
+        return self._use_polling
+
     @property
     def is_running(self) -> bool:
         """Check if the watcher is currently running.
@@ -182,18 +326,20 @@ class WatchdogFileWatcher:
         """
         return self._observer is not None and self._observer.is_alive()
 
-    def start(self, callback: Callable[[FileEvent], None]) -> None:
+    def start(self, callback: FileEventBatchCallback) -> None:
         """Start watching for file changes.
 
         Begins monitoring the configured folder for JSON file system events.
-        When a change is detected (after debouncing), the callback is invoked.
+        Changes are coalesced over the debounce window, and the callback is
+        invoked once per window on the event loop's thread.
 
         Args:
-            callback: Function to call when a file change is detected.
-                     Receives a FileEvent object as its only argument.
+            callback: Function to call when file changes are detected.
+                     Receives a list of FileEvent objects, at most one per path.
 
         Raises:
-            RuntimeError: If the watcher is already running.
+            RuntimeError: If the watcher is already running, or if no loop was
+                given and none is running.
             FileNotFoundError: If the folder path does not exist.
         """
         if self.is_running:
@@ -207,21 +353,90 @@ class WatchdogFileWatcher:
 
         logger.info("Starting file watcher on: %s", self._folder_path)
 
+        loop = self._loop if self._loop is not None else asyncio.get_running_loop()
+
         self._handler = _DebouncedEventHandler(
             callback=callback,
+            loop=loop,
             debounce_delay=self._debounce_delay,
         )
 
-        self._observer = PollingObserver(timeout=1.0)
-        self._observer.schedule(
+        if self._use_polling:
+            self._observer = PollingObserver(timeout=1.0)
+        else:
+            self._observer = Observer()
+        self._watch = self._observer.schedule(
             self._handler,
             str(self._folder_path),
             recursive=False,
         )
+
+        folder = os.path.abspath(self._folder_path)
+        parent = os.path.dirname(folder)
+        if not self._use_polling and parent != folder:
+            self._observer.schedule(
+                _FolderLifecycleHandler(
+                    os.path.join(parent, os.path.basename(folder)),
+                    on_removed=self._on_folder_removed,
+                    on_recreated=self._on_folder_recreated,
+                ),
+                parent,
+                recursive=False,
+            )
         self._observer.start()
 
         logger.info("File watcher started successfully")
 
+    def _on_folder_removed(self) -> None:
+        """Drop the watch on a folder that no longer exists.
+
+        Runs on the observer thread. The native emitter has already stopped,
+        and has to be unscheduled before the same path can be watched again.
+        """
+        logger.warning(
+            "Steps folder removed, waiting for it to be recreated: %s",
+            self._folder_path,
+        )
+        self._unschedule_folder_watch()
+
+    def _on_folder_recreated(self) -> None:
+        """Watch the recreated folder and report the step files already in it.
+
+        Runs on the observer thread. Files written between the folder's
+        creation and the new watch would otherwise never be seen.
+        """
+        if self._observer is None or self._handler is None:
+            return
+
+        self._unschedule_folder_watch()
+        try:
+            self._watch = self._observer.schedule(
+                self._handler,
+                str(self._folder_path),
+                recursive=False,
+            )
+            entries = list(os.scandir(self._folder_path))
+        except OSError as e:
+            # Removed again before the watch was in place; the next
+            # creation event retries
+            logger.warning("Could not watch recreated steps folder: %s", e)
+            return
+
+        logger.info("Steps folder recreated, watching again: %s", self._folder_path)
+        for entry in entries:
+            if self._handler._is_json_file(entry.name) and entry.is_file():
+                self._handler._schedule_callback(entry.path, FileEventType.MODIFIED)
+
+    def _unschedule_folder_watch(self) -> None:
+        """Unschedule the watch on the steps folder, if one is scheduled."""
+        if self._observer is None or self._watch is None:
+            return
+        try:
+            self._observer.unschedule(self._watch)
+        except KeyError:
+            pass
+        self._watch = None
+
     def stop(self) -> None:
         """Stop watching for file changes.
 
@@ -244,5 +459,6 @@ class WatchdogFileWatcher:
             self._observer = None
 
         self._handler = None
+        self._watch = None
 
         logger.info("File watcher stopped successfully")
@@ -4,10 +4,11 @@ Manages active WebSocket connections, providing functionality to track clients,
 broadcast messages to all connected clients, and send messages to individual clients.
 """
 
-import json
+import asyncio
 import logging
 from typing import Any
 
+import orjson
 from fastapi import WebSocket
 
 logger = logging.getLogger(__name__)
@@ -16,54 +17,63 @@ logger = logging.getLogger(__name__)
 class ConnectionManager:
     """Manages WebSocket connections for real-time updates.
 
-    Maintains a list of active WebSocket connections and provides methods
+    Maintains a set of active WebSocket connections and provides methods
     to connect, disconnect, broadcast to all clients, and send to individual
-    clients.
+    clients. Connection order carries no meaning, so a set keeps disconnects
+    O(1) regardless of the number of clients.
 
     Attributes:
         active_connections: List of currently connected WebSocket clients.
     """
 
     def __init__(self) -> None:
-        """Initialize the ConnectionManager with an empty connections list."""
-        self._active_connections: list[WebSocket] = []
+        """Initialize the ConnectionManager with an empty connections set."""
+        self._active_connections: set[WebSocket] = set()
 
     @property
     def active_connections(self) -> list[WebSocket]:
         """Return the list of active WebSocket connections.
 
         Returns:
-            List of connected WebSocket instances.
+            List of connected WebSocket instances (a snapshot copy).
         """
-        return self._active_connections
+        return list(self._active_connections)
+
+    def has_connections(self) -> bool:
+        """Check whether any WebSocket client is connected.
+
+        Returns:
+            True if at least one connection is active, without copying the set.
+        """
+        return bool(self._active_connections)
 
     async def connect(self, websocket: WebSocket) -> None:
         """Accept and register a new WebSocket connection.
 
         Accepts the WebSocket handshake and adds the connection to the
-        active connections list.
+        active connections set.
 
         Args:
             websocket: The WebSocket connection to accept and register.
         """
         await websocket.accept()
-        self._active_connections.append(websocket)
+        self._active_connections.add(websocket)
         logger.info(
             "WebSocket client connected. Total connections: %d",
             len(self._active_connections),
         )
 
     def disconnect(self, websocket: WebSocket) -> None:
-        """Remove a WebSocket connection from the active list.
+        """Remove a WebSocket connection from the active set.
 
-        Safely removes the connection if it exists in the active list.
+        Safely removes the connection if it exists in the active set.
         Does nothing if the connection is not found.
 
         Args:
             websocket: The WebSocket connection to remove.
         """
         if websocket in self._active_connections:
-            self._active_connections.remove(websocket)
+            self._active_connections.discard(websocket)
             logger.info(
                 "WebSocket client disconnected. Total connections: %d",
                 len(self._active_connections),
@@ -74,38 +84,61 @@ class ConnectionManager:
     async def broadcast(self, message: dict[str, Any]) -> None:
         """Send a JSON message to all connected clients.
 
-        Broadcasts the message to all active connections. If a client
-        has disconnected or an error occurs during send, that client
-        is removed from the active connections list and the broadcast
-        continues to remaining clients.
+        Broadcasts the message to all active connections concurrently, so the
+        total time is bounded by the slowest client rather than the sum of all
+        sends. If a client has disconnected or an error occurs during send,
+        that client is removed from the active connections set; the other
+        sends are unaffected.
+
+        The message is serialized once with orjson and the same text frame is
+        sent to every client. Text frames are kept because the frontend parses
+        event.data as a string.
 
         Args:
             message: Dictionary to serialize as JSON and send to all clients.
         """
-        json_message = json.dumps(message)
-        disconnected_clients: list[WebSocket] = []
+        await self.broadcast_text(orjson.dumps(message).decode())
+
+    async def broadcast_text(self, json_message: str) -> None:
+        """Send an already serialized JSON message to all connected clients.
+
+        Lets callers that hold a serialized payload skip re-encoding it.
+        Concurrency and dead-client handling are the same as broadcast().
+
+        Args:
+            json_message: JSON text to send as a single text frame.
+        """
+        if not self._active_connections:
+            return
+
+        # Snapshot so that clients connecting mid-broadcast don't shift the
+        # pairing between connections and results
+        connections = list(self._active_connections)
 
         logger.info(
             "Broadcasting message to %d clients: %s",
-            len(self._active_connections),
+            len(connections),
             json_message[:200],
         )
 
-        for connection in self._active_connections:
-            try:
-                await connection.send_text(json_message)
-                logger.info("Message sent successfully to client")
-            except Exception as e:
+        results = await asyncio.gather(
+            *(connection.send_text(json_message) for connection in connections),
+            return_exceptions=True,
+        )
+
+        disconnected_clients: list[WebSocket] = []
+        for connection, result in zip(connections, results):
+            if isinstance(result, Exception):
                 logger.warning(
                     "Failed to send message to client: %s. Marking for removal.",
-                    str(e),
+                    str(result),
                 )
                 disconnected_clients.append(connection)
 
-        # Remove disconnected clients after iteration
+        # Remove disconnected clients after all sends have completed
         for client in disconnected_clients:
             if client in self._active_connections:
-                self._active_connections.remove(client)
+                self._active_connections.discard(client)
                 logger.info(
                     "Removed disconnected client. Total connections: %d",
                     len(self._active_connections),
@@ -127,9 +160,23 @@ class ConnectionManager:
         Raises:
             Exception: Re-raises any exception from the WebSocket send operation.
         """
-        json_message = json.dumps(message)
+        await self.send_personal_text(websocket, orjson.dumps(message).decode())
+
+    async def send_personal_text(self, websocket: WebSocket, text: str) -> None:
+        """Send an already serialized JSON message to a single client.
+
+        Lets callers that send the same payload to many clients serialize
+        it only once. Error handling is the same as send_personal().
+
+        Args:
+            websocket: The WebSocket connection to send the message to.
+            text: JSON text to send as a single text frame.
+
+        Raises:
+            Exception: Re-raises any exception from the WebSocket send operation.
+        """
         try:
-            await websocket.send_text(json_message)
+            await websocket.send_text(text)
         except Exception as e:
             logger.error("Failed to send personal message to client: %s", str(e))
             raise
@@ -4,9 +4,11 @@ Orchestrates step operations by coordinating between the StepRepository and
 FileWatcher ports, translating file events into step updates.
 """
 
+import asyncio
 import logging
-import re
-from typing import Callable
+import os
+import threading
+from typing import Awaitable, Callable
 
 from domain.events import FileEvent, FileEventType
 from domain.step import Step
@@ -16,7 +18,10 @@ from ports.step_repository import StepRepository
 logger = logging.getLogger(__name__)
 
 # Type alias for the step update callback
-StepUpdateCallback = Callable[[str, Step | None], None]
+StepUpdateCallback = Callable[[str, Step | None], Awaitable[None]]
+
+# Maximum number of event batches waiting for the consumer task
+_EVENT_QUEUE_SIZE = 1024
 
 
 class StepService:
@@ -24,7 +29,14 @@ class StepService:
 
     Orchestrates step operations by coordinating between the repository for
     data access and the file watcher for real-time updates. Maintains an
-    in-memory cache of steps for fast access.
+    in-memory cache of steps for fast access. The cache is loaded once and
+    then kept current by file events only, so the folder is never re-parsed
+    on the hot path.
+
+    File events are only enqueued by the watcher callback. A consumer task on
+    the event loop drains the queue, refreshes the affected steps and awaits
+    the update callback, so the watcher never blocks on disk reads or client
+    sends.
 
     Attributes:
         repository: The step repository for data access.
@@ -45,8 +57,15 @@ class StepService:
         self._repository = repository
         self._file_watcher = file_watcher
         self._steps_cache: dict[str, Step] = {}
+        self._cache_loaded = False
+        # Refreshes are applied on the event loop while reads may come from
+        # other threads, so every cache access goes through this lock.
+        self._cache_lock = threading.Lock()
         self._callback: StepUpdateCallback | None = None
         self._watching = False
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._event_queue: asyncio.Queue[list[FileEvent]] | None = None
+        self._consumer_task: asyncio.Task[None] | None = None
 
     @property
     def repository(self) -> StepRepository:
@@ -68,50 +87,58 @@ class StepService:
         return self._watching
 
     def get_all_steps(self) -> list[Step]:
-        """Retrieve all steps, using cache if available.
+        """Retrieve all steps from the cache.
 
         On first call, loads all steps from the repository into cache.
-        Subsequent calls return cached data.
+        Subsequent calls return cached data, which file events keep current.
 
         Returns:
             List of all Step objects.
         """
-        if not self._steps_cache:
+        if not self._cache_loaded:
             self._load_steps_into_cache()
 
-        return list(self._steps_cache.values())
+        with self._cache_lock:
+            return list(self._steps_cache.values())
 
     def _load_steps_into_cache(self) -> None:
         """Load all steps from repository into the in-memory cache."""
         steps = self._repository.get_all()
-        self._steps_cache = {step.task_id: step for step in steps}
-        logger.debug("Loaded %d steps into cache", len(self._steps_cache))
+        with self._cache_lock:
+            self._steps_cache = {step.task_id: step for step in steps}
+            self._cache_loaded = True
+        logger.debug("Loaded %d steps into cache", len(steps))
 
     def start_watching(self, callback: StepUpdateCallback) -> None:
         """Start watching for file changes and translating them to step updates.
 
         Begins monitoring for file changes. When a change is detected,
-        refreshes the affected step from the repository and invokes the
-        callback with the event type and updated step.
+        refreshes the affected step from the repository and awaits the
+        callback with the event type and updated step. Must be called from
+        within a running event loop, which hosts the consumer task.
 
         Args:
-            callback: Function to call when a step is updated.
+            callback: Coroutine function to call when a step is updated.
                      Receives (event_type: str, step: Step | None).
                      event_type is one of: 'created', 'modified', 'deleted'.
                      step is the updated Step object, or None for deletions.
 
         Raises:
-            RuntimeError: If already watching.
+            RuntimeError: If already watching, or if no event loop is running.
         """
         if self._watching:
             raise RuntimeError("StepService is already watching for changes")
 
+        self._loop = asyncio.get_running_loop()
+
         # Ensure cache is populated before starting to watch
-        if not self._steps_cache:
+        if not self._cache_loaded:
             self._load_steps_into_cache()
 
         self._callback = callback
-        self._file_watcher.start(self._handle_file_event)
+        self._event_queue = asyncio.Queue(maxsize=_EVENT_QUEUE_SIZE)
+        self._consumer_task = self._loop.create_task(self._consume_file_events())
+        self._file_watcher.start(self._enqueue_file_events)
         self._watching = True
 
         logger.info("StepService started watching for file changes")
@@ -128,58 +155,149 @@ class StepService:
             return
 
         self._file_watcher.stop()
+        if self._consumer_task is not None:
+            self._consumer_task.cancel()
+            self._consumer_task = None
+        self._event_queue = None
         self._watching = False
         self._callback = None
 
         logger.info("StepService stopped watching for file changes")
 
-    def _handle_file_event(self, file_event: FileEvent) -> None:
-        """Handle a file event from the file watcher.
+    def _enqueue_file_events(self, file_events: list[FileEvent]) -> None:
+        """Hand a batch of file events from the file watcher to the queue.
+
+        May be called from any thread; the batch is put on the queue from the
+        event loop's thread, so the watcher returns immediately.
+
+        Args:
+            file_events: The file events received from the watcher.
+        """
+        if self._loop is None:
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._put_file_events, file_events)
+        except RuntimeError:
+            logger.debug("Event loop closed, dropping %d file events", len(file_events))
 
-        Translates the file event to a step update by extracting the task_id
-        from the file path, refreshing the step from the repository, and
-        invoking the callback.
+    def _put_file_events(self, file_events: list[FileEvent]) -> None:
+        """Put a batch of file events on the queue without blocking.
 
         Args:
-            file_event: The file event received from the watcher.
+            file_events: The file events received from the watcher.
         """
-        task_id = self._extract_task_id_from_path(file_event.file_path)
-        if task_id is None:
+        if self._event_queue is None:
+            return
+        try:
+            self._event_queue.put_nowait(file_events)
+        except asyncio.QueueFull:
             logger.warning(
-                "Could not extract task_id from file path: %s",
-                file_event.file_path,
+                "Event queue full, dropping %d file events", len(file_events)
             )
+
+    async def _consume_file_events(self) -> None:
+        """Drain the event queue, applying each batch and notifying the callback.
+
+        Repository reads run in a worker thread to keep the event loop free.
+        Errors are isolated per file and per update, so one failure neither
+        drops the rest of its batch nor stops the consumer.
+        """
+        queue = self._event_queue
+        if queue is None:
             return
 
-        event_type = file_event.event_type.value
-        step: Step | None = None
-
-        if file_event.event_type == FileEventType.DELETED:
-            # For deletions, remove from cache and pass None
-            step = self._steps_cache.pop(task_id, None)
-            logger.debug("Step deleted: %s", task_id)
-        else:
-            # For created or modified, refresh from repository
-            step = self._repository.refresh(task_id)
-            if step is not None:
-                self._steps_cache[task_id] = step
-                logger.debug("Step %s: %s", event_type, task_id)
-            else:
+        while True:
+            file_events = await queue.get()
+            try:
+                refreshed = await asyncio.to_thread(self._refresh_steps, file_events)
+                updates = self._apply_to_cache(refreshed)
+
+                callback = self._callback
+                if callback is not None:
+                    for event_type, step in updates:
+                        try:
+                            await callback(event_type, step)
+                        except Exception:
+                            logger.exception("Step update callback failed for %s event", event_type)
+            except Exception:
+                logger.exception("Failed to process %d file events", len(file_events))
+            finally:
+                queue.task_done()
+
+    def _refresh_steps(
+        self, file_events: list[FileEvent]
+    ) -> list[tuple[FileEventType, str, Step | None]]:
+        """Re-read the steps affected by a batch of file events.
+
+        Translates each file event to a task_id extracted from the file path
+        and, for creations and modifications, refreshes the step from the
+        repository.
+
+        Args:
+            file_events: The file events received from the watcher.
+
+        Returns:
+            List of (event type, task_id, refreshed step) tuples. The step is
+            None for deletions and for files that could not be read.
+        """
+        refreshed: list[tuple[FileEventType, str, Step | None]] = []
+
+        for file_event in file_events:
+            task_id = self._extract_task_id_from_path(file_event.file_path)
+            if task_id is None:
                 logger.warning(
-                    "Could not refresh step for task_id '%s' after %s event",
-                    task_id,
-                    event_type,
+                    "Could not extract task_id from file path: %s",
+                    file_event.file_path,
                 )
+                continue
+
+            step: Step | None = None
+            if file_event.event_type != FileEventType.DELETED:
+                # For created or modified, refresh from repository
+                try:
+                    step = self._repository.refresh(task_id)
+                except Exception:
+                    logger.exception("Failed to refresh step for task_id '%s'", task_id)
+                if step is None:
+                    logger.warning(
+                        "Could not refresh step for task_id '%s' after %s event",
+                        task_id,
+                        file_event.event_type.value,
+                    )
+            refreshed.append((file_event.event_type, task_id, step))
+
+        return refreshed
+
+    def _apply_to_cache(
+        self, refreshed: list[tuple[FileEventType, str, Step | None]]
+    ) -> list[tuple[str, Step | None]]:
+        """Apply refreshed steps to the cache under a single lock acquisition.
 
-        # Invoke callback with event type and step
-        if self._callback is not None:
-            self._callback(event_type, step)
+        Args:
+            refreshed: Output of _refresh_steps for one batch.
+
+        Returns:
+            List of (event_type, step) pairs to pass to the update callback.
+        """
+        updates: list[tuple[str, Step | None]] = []
+        with self._cache_lock:
+            for event_type, task_id, step in refreshed:
+                if event_type == FileEventType.DELETED:
+                    # For deletions, remove from cache and pass the removed step
+                    step = self._steps_cache.pop(task_id, None)
+                elif step is not None:
+                    self._steps_cache[task_id] = step
+                logger.debug("Step %s: %s", event_type.value, task_id)
+                updates.append((event_type.value, step))
+        return updates
 
     @staticmethod
     def _extract_task_id_from_path(file_path: str) -> str | None:
         """Extract task_id from a file path.
 
         Assumes the file is named with the task_id pattern (e.g., '01-02.json').
+        Runs for every file event, so it sticks to plain string operations
+        instead of os.path and the regex engine.
 
         Args:
             file_path: The full path to the step file.
@@ -188,17 +306,21 @@ class StepService:
             The extracted task_id (e.g., '01-02'), or None if extraction fails.
         """
         # Extract filename from path
-        import os
-
-        filename = os.path.basename(file_path)
+        filename = file_path.rpartition(os.sep)[2]
+        if os.altsep:
+            filename = filename.rpartition(os.altsep)[2]
 
         # Remove .json extension if present
         if filename.endswith(".json"):
             filename = filename[:-5]
 
         # Validate task_id format (XX-YY where X and Y are digits)
-        pattern = r"^\d{2}-\d{2}$"
-        if re.match(pattern, filename):
+        if (
+            len(filename) == 5
+            and filename[2] == "-"
+            and filename[:2].isdecimal()
+            and filename[3:].isdecimal()
+        ):
             return filename
 
         return None
@@ -15,7 +15,7 @@ class FileEventType(Enum):
     DELETED = "deleted"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FileEvent:
     """Domain object representing a file change event.
 
@@ -3,6 +3,7 @@
 This module defines the core domain model for workflow steps in nwwatch.
 """
 
+import functools
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
@@ -18,7 +19,11 @@ class StepStatus(Enum):
     SKIPPED = "skipped"
 
 
-@dataclass
+# Direct value lookup, avoiding the Enum call machinery on every parsed file
+_STATUS_BY_VALUE: dict[str, StepStatus] = {status.value: status for status in StepStatus}
+
+
+@dataclass(slots=True)
 class Step:
     """Domain entity representing a workflow step.
 
@@ -48,9 +53,13 @@ class Step:
             )
 
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def _parse_version_from_task_id(task_id: str) -> tuple[int, int]:
         """Parse major and minor version numbers from task_id.
 
+        Results are cached, since the same task_ids are parsed again on every
+        refresh of their step file.
+
         Args:
             task_id: Task identifier in format 'XX-YY' (e.g., '01-02')
 
@@ -98,13 +107,13 @@ class Step:
             KeyError: If required keys are missing
             ValueError: If validation.status is not a valid StepStatus
         """
-        validation = data.get("validation", {})
-        status_str = validation.get("status", "pending")
+        validation = data.get("validation")
+        status_str = validation.get("status", "pending") if validation else "pending"
 
         try:
-            status = StepStatus(status_str)
-        except ValueError:
-            valid_statuses = [s.value for s in StepStatus]
+            status = _STATUS_BY_VALUE[status_str]
+        except (KeyError, TypeError):
+            valid_statuses = list(_STATUS_BY_VALUE)
             raise ValueError(
                 f"Invalid status '{status_str}'. Must be one of: {valid_statuses}"
             )
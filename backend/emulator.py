@@ -5,12 +5,26 @@ Creates and updates step JSON files to simulate a real nWave workflow.
 
 import argparse
 import json
+import logging
+import logging.handlers
 import os
 import random
-import shutil
+import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # The emulator can run without the backend's dependencies
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Log records held back before writing to stdout in full-speed runs
+LOG_BUFFER_CAPACITY = 64
+
 # Sample phases and descriptions for realistic simulation
 PHASES = ["research", "design", "implement", "test", "deploy"]
 
@@ -48,9 +62,41 @@ DESCRIPTIONS = {
     ],
 }
 
+# Number of threads used to write the initial step files
+MAX_WRITE_WORKERS = 8
+
+# Flags for opening a temporary step file with a raw descriptor
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+# Authoritative in-memory copy of every step file written, keyed by task_id
+_step_cache: dict[str, dict] = {}
+
+
+def reset_step_folder(folder: Path) -> None:
+    """Create the steps folder if needed and remove its step files.
+
+    Only *.json files, and *.json.tmp files left by interrupted writes, are
+    unlinked; the folder itself is kept, so a running viewer's watch on it
+    stays valid, and other files are left untouched.
+    """
+    folder.mkdir(parents=True, exist_ok=True)
+    for pattern in ("*.json", "*.json.tmp"):
+        for path in folder.glob(pattern):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+    _step_cache.clear()
+
 
 def create_step_file(folder: Path, task_id: str, project_id: str, phase: str, description: str, status: str) -> None:
     """Create a step JSON file."""
+    _write_new_step(folder, task_id, project_id, phase, description, status)
+    _log_step_created(task_id, description, status)
+
+
+def _write_new_step(folder: Path, task_id: str, project_id: str, phase: str, description: str, status: str) -> None:
+    """Record a new step in the cache and write its file, without logging."""
     data = {
         "task_id": task_id,
         "project_id": project_id,
@@ -61,233 +107,313 @@ def create_step_file(folder: Path, task_id: str, project_id: str, phase: str, de
         }
     }
 
-    file_path = folder / f"{task_id}.json"
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    _step_cache[task_id] = data
+    write_step_file(folder, data)
+
+
+def _log_step_created(task_id: str, description: str, status: str) -> None:
+    """Log the creation of a step."""
+    logger.info("  [%-11s] %s: %.50s...", status.upper(), task_id, description)
+
+
+def serialize_step(data: dict) -> bytes:
+    """Serialize step data to indented JSON bytes.
 
-    print(f"  [{status.upper():11}] {task_id}: {description[:50]}...")
+    Uses orjson when available, otherwise the stdlib JSON encoder. Every key
+    is kept, including ones the emulator does not set itself.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+    return json.dumps(data, indent=2).encode()
+
+
+def write_step_file(folder: Path, data: dict) -> None:
+    """Write step data to its JSON file atomically.
+
+    The data goes to a temporary file that is then renamed over the target,
+    so a watcher never reads a partially written step.
+    """
+    file_path = folder / f"{data['task_id']}.json"
+    tmp_path = file_path.with_suffix(".json.tmp")
+
+    # Write the serialized bytes straight to a descriptor; a buffered file
+    # object would only add allocations and a copy for a single write
+    payload = memoryview(serialize_step(data))
+    fd = os.open(tmp_path, _WRITE_FLAGS, 0o644)
+    try:
+        while payload:
+            payload = payload[os.write(fd, payload):]
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, file_path)
 
 
 def update_step_status(folder: Path, task_id: str, new_status: str) -> None:
-    """Update the status of an existing step file."""
-    file_path = folder / f"{task_id}.json"
+    """Update the status of an existing step file.
 
-    with open(file_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    The in-memory copy is authoritative, so the file is only written, not
+    re-read. Steps not created by this process are loaded from disk once.
+    """
+    data = _step_cache.get(task_id)
+    if data is None:
+        raw = (folder / f"{task_id}.json").read_bytes()
+        data = _step_cache[task_id] = orjson.loads(raw) if orjson is not None else json.loads(raw)
 
     old_status = data["validation"]["status"]
     data["validation"]["status"] = new_status
 
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    write_step_file(folder, data)
+
+    logger.info("  [%-11s] -> [%-11s] %s", old_status.upper(), new_status.upper(), task_id)
+
+
+@dataclass(slots=True)
+class Steps:
+    """Step definitions stored as parallel lists, one entry per step."""
+
+    task_ids: list[str] = field(default_factory=list)
+    phases: list[str] = field(default_factory=list)
+    descriptions: list[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.task_ids)
+
+
+def create_step_files(folder: Path, project_id: str, steps: Steps, status: str) -> None:
+    """Create a step JSON file for every step, writing them concurrently.
+
+    The files are written by worker threads; their creation is logged
+    afterwards in step order, so the listing does not depend on scheduling.
+    """
+    if not steps:
+        return
+
+    with ThreadPoolExecutor(max_workers=min(MAX_WRITE_WORKERS, len(steps))) as executor:
+        list(executor.map(
+            lambda task_id, phase, description: _write_new_step(
+                folder,
+                task_id,
+                project_id,
+                phase,
+                description,
+                status
+            ),
+            steps.task_ids,
+            steps.phases,
+            steps.descriptions
+        ))
 
-    print(f"  [{old_status.upper():11}] -> [{new_status.upper():11}] {task_id}")
+    for task_id, description in zip(steps.task_ids, steps.descriptions):
+        _log_step_created(task_id, description, status)
 
 
-def generate_steps(num_steps: int = 15) -> list[dict]:
-    """Generate a list of step definitions."""
-    steps = []
-    major = 1
-    minor = 1
+def generate_steps(num_steps: int = 15) -> Steps:
+    """Generate the step definitions."""
+    steps_per_phase = num_steps // len(PHASES) + 1
+    steps = Steps()
 
-    for phase in PHASES:
+    for major, phase in enumerate(PHASES, 1):
         descriptions = DESCRIPTIONS[phase]
-        num_phase_steps = min(len(descriptions), num_steps // len(PHASES) + 1)
+        count = min(len(descriptions), steps_per_phase, num_steps - len(steps))
+        steps.task_ids.extend(f"{major:02d}-{minor:02d}" for minor in range(1, count + 1))
+        steps.phases.extend([phase] * count)
+        steps.descriptions.extend(descriptions[:count])
+        if len(steps) >= num_steps:
+            break
 
-        for i in range(num_phase_steps):
-            if len(steps) >= num_steps:
-                break
+    return steps
 
-            task_id = f"{major:02d}-{minor:02d}"
-            steps.append({
-                "task_id": task_id,
-                "phase": phase,
-                "description": descriptions[i % len(descriptions)],
-            })
-            minor += 1
 
-        major += 1
-        minor = 1
+def _no_sleep(seconds: float) -> None:
+    """Stand-in for time.sleep when the simulation runs without delays."""
 
-    return steps[:num_steps]
 
+def run_simulation(folder: Path, project_id: str, num_steps: int, delay: float, failure_rate: float,
+                   visual_delay: float = 0.0) -> None:
+    """Run the step simulation.
 
-def run_simulation(folder: Path, project_id: str, num_steps: int, delay: float, failure_rate: float) -> None:
-    """Run the step simulation."""
+    With a visual_delay the initial steps are created one at a time, that many
+    seconds apart, so they appear gradually; otherwise they are written at once.
+    """
 
-    # Clean and create folder
-    if folder.exists():
-        shutil.rmtree(folder)
-    folder.mkdir(parents=True)
+    reset_step_folder(folder)
 
-    print(f"\nStarting simulation in: {folder}")
-    print(f"Project: {project_id}")
-    print(f"Steps: {num_steps}, Delay: {delay}s, Failure rate: {failure_rate*100:.0f}%\n")
+    logger.info("\nStarting simulation in: %s", folder)
+    logger.info("Project: %s", project_id)
+    logger.info("Steps: %d, Delay: %ss, Failure rate: %.0f%%\n", num_steps, delay, failure_rate * 100)
 
     steps = generate_steps(num_steps)
 
     # Phase 1: Create all steps as pending
-    print("Creating initial steps (all pending)...")
-    for step in steps:
-        create_step_file(
-            folder,
-            step["task_id"],
-            project_id,
-            step["phase"],
-            step["description"],
-            "pending"
-        )
-        time.sleep(0.1)  # Small delay for visual effect
-
-    print(f"\nCreated {len(steps)} steps. Starting workflow simulation...\n")
-    time.sleep(delay)
+    logger.info("Creating initial steps (all pending)...")
+    if visual_delay > 0:
+        for task_id, phase, description in zip(steps.task_ids, steps.phases, steps.descriptions):
+            create_step_file(folder, task_id, project_id, phase, description, "pending")
+            time.sleep(visual_delay)
+    else:
+        create_step_files(folder, project_id, steps, "pending")
 
-    # Phase 2: Progress through steps
-    for i, step in enumerate(steps):
-        task_id = step["task_id"]
+    # With no delay the run is bounded only by file I/O, so skip sleeping
+    sleep = time.sleep if delay > 0 else _no_sleep
+    half_delay = delay * 0.5
+
+    logger.info("\nCreated %d steps. Starting workflow simulation...\n", len(steps))
+    sleep(delay)
 
+    # Phase 2: Progress through steps
+    for i, task_id in enumerate(steps.task_ids):
         # Set current step to in_progress
-        print(f"\nStep {i+1}/{len(steps)}: {task_id}")
+        logger.info("\nStep %d/%d: %s", i + 1, len(steps), task_id)
         update_step_status(folder, task_id, "in_progress")
 
         # Simulate work being done
-        work_time = delay * random.uniform(0.5, 1.5)
-        time.sleep(work_time)
+        sleep(delay * random.uniform(0.5, 1.5))
 
         # Determine outcome
         if random.random() < failure_rate:
             # Step failed
             update_step_status(folder, task_id, "failed")
-            print(f"  Step {task_id} failed! Retrying...")
-            time.sleep(delay * 0.5)
+            logger.info("  Step %s failed! Retrying...", task_id)
+            sleep(half_delay)
 
             # Retry: back to in_progress
             update_step_status(folder, task_id, "in_progress")
-            time.sleep(delay * 0.5)
+            sleep(half_delay)
 
             # 80% chance to succeed on retry
             if random.random() < 0.8:
                 update_step_status(folder, task_id, "completed")
             else:
                 update_step_status(folder, task_id, "skipped")
-                print(f"  Step {task_id} skipped after retry failure")
+                logger.info("  Step %s skipped after retry failure", task_id)
         else:
             # Step completed successfully
             update_step_status(folder, task_id, "completed")
 
-    print("\n" + "=" * 50)
-    print("Simulation complete!")
-    print("=" * 50)
+    logger.info("\n%s\nSimulation complete!\n%s", "=" * 50, "=" * 50)
 
 
 def run_interactive(folder: Path, project_id: str, num_steps: int) -> None:
     """Run in interactive mode - user controls progression."""
 
-    # Clean and create folder
-    if folder.exists():
-        shutil.rmtree(folder)
-    folder.mkdir(parents=True)
-
-    print(f"\nInteractive mode - folder: {folder}")
-    print(f"Project: {project_id}\n")
-
-    steps = generate_steps(num_steps)
-
-    # Create all steps as pending
-    print("Creating initial steps...")
-    for step in steps:
-        create_step_file(
-            folder,
-            step["task_id"],
-            project_id,
-            step["phase"],
-            step["description"],
-            "pending"
-        )
-
-    print(f"\nCreated {len(steps)} steps.\n")
-    print("Commands:")
-    print("  n / next     - Move to next step (complete current, start next)")
-    print("  f / fail     - Fail current step")
-    print("  s / skip     - Skip current step")
-    print("  a / auto     - Switch to automatic mode (continue without interaction)")
-    print("  r / restart  - Restart simulation")
-    print("  q / quit     - Exit\n")
-
-    current_idx = 0
-
-    # Start first step
-    update_step_status(folder, steps[0]["task_id"], "in_progress")
-    print(f"Current step: {steps[0]['task_id']} - {steps[0]['description']}\n")
-
+    # Each pass is one session; restarting begins a new pass instead of recursing
     while True:
-        try:
-            cmd = input("> ").strip().lower()
-        except (KeyboardInterrupt, EOFError):
-            print("\nExiting...")
-            break
-
-        if cmd in ("q", "quit", "exit"):
-            print("Exiting...")
-            break
+        reset_step_folder(folder)
+
+        print(f"\nInteractive mode - folder: {folder}")
+        print(f"Project: {project_id}\n")
+
+        steps = generate_steps(num_steps)
+
+        # Create all steps as pending
+        print("Creating initial steps...")
+        create_step_files(folder, project_id, steps, "pending")
+
+        print(f"\nCreated {len(steps)} steps.\n")
+        print("Commands:")
+        print("  n / next     - Move to next step (complete current, start next)")
+        print("  f / fail     - Fail current step")
+        print("  s / skip     - Skip current step")
+        print("  a / auto     - Switch to automatic mode (continue without interaction)")
+        print("  r / restart  - Restart simulation")
+        print("  q / quit     - Exit\n")
+
+        current_idx = 0
+
+        # Start first step
+        update_step_status(folder, steps.task_ids[0], "in_progress")
+        print(f"Current step: {steps.task_ids[0]} - {steps.descriptions[0]}\n")
+
+        restart = False
+        while True:
+            try:
+                cmd = input("> ").strip().lower()
+            except (KeyboardInterrupt, EOFError):
+                print("\nExiting...")
+                break
 
-        elif cmd in ("n", "next"):
-            if current_idx < len(steps):
-                # Complete current step
-                update_step_status(folder, steps[current_idx]["task_id"], "completed")
-                current_idx += 1
+            if cmd in ("q", "quit", "exit"):
+                print("Exiting...")
+                break
 
+            elif cmd in ("n", "next"):
                 if current_idx < len(steps):
-                    # Start next step
-                    update_step_status(folder, steps[current_idx]["task_id"], "in_progress")
-                    print(f"Current step: {steps[current_idx]['task_id']} - {steps[current_idx]['description']}\n")
-                else:
-                    print("\nAll steps completed!")
-
-        elif cmd in ("f", "fail"):
-            if current_idx < len(steps):
-                update_step_status(folder, steps[current_idx]["task_id"], "failed")
-                print(f"Step {steps[current_idx]['task_id']} marked as failed. Use 'n' to retry or 's' to skip.\n")
-
-        elif cmd in ("s", "skip"):
-            if current_idx < len(steps):
-                update_step_status(folder, steps[current_idx]["task_id"], "skipped")
-                current_idx += 1
-
+                    # Complete current step
+                    update_step_status(folder, steps.task_ids[current_idx], "completed")
+                    current_idx += 1
+
+                    if current_idx < len(steps):
+                        # Start next step
+                        update_step_status(folder, steps.task_ids[current_idx], "in_progress")
+                        print(f"Current step: {steps.task_ids[current_idx]} - {steps.descriptions[current_idx]}\n")
+                    else:
+                        print("\nAll steps completed!")
+
+            elif cmd in ("f", "fail"):
                 if current_idx < len(steps):
-                    update_step_status(folder, steps[current_idx]["task_id"], "in_progress")
-                    print(f"Current step: {steps[current_idx]['task_id']} - {steps[current_idx]['description']}\n")
-                else:
-                    print("\nAll steps processed!")
-
-        elif cmd in ("a", "auto"):
-            print("\nSwitching to automatic mode...\n")
-            # Continue from current step automatically
-            delay = 2.0
-            while current_idx < len(steps):
-                task_id = steps[current_idx]["task_id"]
-                print(f"Step {current_idx + 1}/{len(steps)}: {task_id}")
-
-                # Complete current step
-                update_step_status(folder, steps[current_idx]["task_id"], "completed")
-                current_idx += 1
+                    update_step_status(folder, steps.task_ids[current_idx], "failed")
+                    print(f"Step {steps.task_ids[current_idx]} marked as failed. Use 'n' to retry or 's' to skip.\n")
 
+            elif cmd in ("s", "skip"):
                 if current_idx < len(steps):
-                    # Start next step
-                    time.sleep(delay * 0.5)
-                    update_step_status(folder, steps[current_idx]["task_id"], "in_progress")
-                    time.sleep(delay * 0.5)
+                    update_step_status(folder, steps.task_ids[current_idx], "skipped")
+                    current_idx += 1
+
+                    if current_idx < len(steps):
+                        update_step_status(folder, steps.task_ids[current_idx], "in_progress")
+                        print(f"Current step: {steps.task_ids[current_idx]} - {steps.descriptions[current_idx]}\n")
+                    else:
+                        print("\nAll steps processed!")
+
+            elif cmd in ("a", "auto"):
+                print("\nSwitching to automatic mode...\n")
+                # Continue from current step automatically
+                delay = 2.0
+                while current_idx < len(steps):
+                    task_id = steps.task_ids[current_idx]
+                    print(f"Step {current_idx + 1}/{len(steps)}: {task_id}")
+
+                    # Complete current step
+                    update_step_status(folder, steps.task_ids[current_idx], "completed")
+                    current_idx += 1
+
+                    if current_idx < len(steps):
+                        # Start next step
+                        time.sleep(delay * 0.5)
+                        update_step_status(folder, steps.task_ids[current_idx], "in_progress")
+                        time.sleep(delay * 0.5)
+
+                print("\nAll steps completed!")
+                break
 
-            print("\nAll steps completed!")
-            break
+            elif cmd in ("r", "restart"):
+                print("\nRestarting simulation...\n")
+                restart = True
+                break
 
-        elif cmd in ("r", "restart"):
-            print("\nRestarting simulation...\n")
-            run_interactive(folder, project_id, num_steps)
+            else:
+                print("Unknown command. Use: n(ext), f(ail), s(kip), a(uto), r(estart), q(uit)")
+
+        if not restart:
             break
 
-        else:
-            print("Unknown command. Use: n(ext), f(ail), s(kip), a(uto), r(estart), q(uit)")
+
+def configure_logging(buffered: bool) -> None:
+    """Send emulator log messages to stdout as plain lines.
+
+    Args:
+        buffered: Hold back up to LOG_BUFFER_CAPACITY records and write
+            them together, for runs too fast to follow live.
+    """
+    handler: logging.Handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    if buffered:
+        handler = logging.handlers.MemoryHandler(LOG_BUFFER_CAPACITY, target=handler)
+
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
 
 
 def main() -> None:
@@ -333,15 +459,24 @@ def main() -> None:
         action="store_true",
         help="Run in interactive mode (manual step progression)"
     )
+    parser.add_argument(
+        "--visual-delay",
+        type=float,
+        default=0.0,
+        help="Seconds between initial step creations in automatic mode, e.g. 0.1 for demos (default: 0)"
+    )
 
     args = parser.parse_args()
     folder = Path(args.folder).resolve()
 
+    # Buffer output only when nobody can watch it in real time
+    configure_logging(buffered=not args.interactive and args.delay == 0)
+
     try:
         if args.interactive:
             run_interactive(folder, args.project, args.steps)
         else:
-            run_simulation(folder, args.project, args.steps, args.delay, args.failure_rate)
+            run_simulation(folder, args.project, args.steps, args.delay, args.failure_rate, args.visual_delay)
     except KeyboardInterrupt:
         print("\n\nSimulation interrupted.")
 
@@ -9,8 +9,9 @@ import logging
 import sys
 from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
 
+import orjson
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
@@ -28,10 +29,24 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Linux limit on inotify watches per user, and the lowest value that leaves
+# headroom for the viewer next to editors and other watchers
+INOTIFY_MAX_WATCHES_PATH = Path("/proc/sys/fs/inotify/max_user_watches")
+MIN_INOTIFY_WATCHES = 8192
+
 # Global instances
 connection_manager = ConnectionManager()
 step_service: StepService | None = None
-main_event_loop: asyncio.AbstractEventLoop | None = None
+
+# Serialized init message shared by all clients until the next step update
+_init_payload: str | None = None
+
+# Seconds to collect step updates before broadcasting them together
+BROADCAST_COALESCE_DELAY = 0.02
+
+# Latest pending message per task_id, sent by the next coalesced broadcast
+_pending_updates: dict[str, dict[str, Any]] = {}
+_flush_task: asyncio.Task[None] | None = None
 
 
 def get_steps_folder_path() -> str:
@@ -49,6 +64,27 @@ def get_steps_folder_path() -> str:
     return sys.argv[1]
 
 
+def check_inotify_watch_limit() -> None:
+    """Warn if the inotify watch limit is low enough to lose file events.
+
+    The native observer silently misses changes once the limit is reached,
+    leaving clients stale. Does nothing where the limit is not exposed
+    (non-Linux systems).
+    """
+    try:
+        max_watches = int(INOTIFY_MAX_WATCHES_PATH.read_text())
+    except (OSError, ValueError):
+        return
+
+    if max_watches < MIN_INOTIFY_WATCHES:
+        logger.warning(
+            "inotify max_user_watches is %d (below %d); file changes may be missed. "
+            "Raise fs.inotify.max_user_watches with sysctl.",
+            max_watches,
+            MIN_INOTIFY_WATCHES,
+        )
+
+
 def create_step_service(steps_folder: str) -> StepService:
     """Create and configure the StepService with repository and file watcher.
 
@@ -58,20 +94,60 @@ def create_step_service(steps_folder: str) -> StepService:
     Returns:
         Configured StepService instance.
     """
+    check_inotify_watch_limit()
     repository = JsonFileRepository(steps_folder)
     file_watcher = WatchdogFileWatcher(steps_folder)
     return StepService(repository, file_watcher)
 
 
+def get_init_payload(service: StepService) -> str:
+    """Return the serialized init message carrying all current steps.
+
+    The payload is built once and reused for every client that connects
+    until a step update invalidates it. Building it involves no await, so
+    concurrent connections on the event loop cannot race on the cache.
+
+    Args:
+        service: The StepService holding the current steps.
+
+    Returns:
+        JSON text of the init message.
+    """
+    global _init_payload
+
+    if _init_payload is None:
+        steps = service.get_all_steps()
+        _init_payload = orjson.dumps(
+            {"type": "init", "steps": [step.to_dict() for step in steps]}
+        ).decode()
+        logger.debug("Built init payload with %d steps", len(steps))
+    return _init_payload
+
+
 async def handle_step_update(event_type: str, step: Step | None) -> None:
     """Handle step update events from the file watcher.
 
-    Broadcasts updates to all connected WebSocket clients.
+    Awaited by the StepService consumer task on the main event loop.
+    Invalidates the cached init payload and queues the update for the next
+    coalesced broadcast to all connected WebSocket clients. Only the latest
+    update per step is kept, so rapid successive changes to the same step
+    are sent once. With no clients connected the message is not built at
+    all and queued updates are dropped: they are all older than what the
+    next client receives in its fresh init message.
 
     Args:
         event_type: Type of event ('created', 'modified', 'deleted').
         step: The updated Step object, or None for deletions.
     """
+    global _init_payload, _flush_task
+
+    _init_payload = None
+
+    if not connection_manager.has_connections():
+        logger.debug("No clients connected, skipping %s broadcast", event_type)
+        _pending_updates.clear()
+        return
+
     if event_type == "deleted" and step is not None:
         # For deletions, send remove message with task_id
         message = {"type": "remove", "taskId": step.task_id}
@@ -85,29 +161,39 @@ async def handle_step_update(event_type: str, step: Step | None) -> None:
         logger.warning("Received %s event with None step", event_type)
         return
 
-    await connection_manager.broadcast(message)
-
+    _pending_updates[step.task_id] = message
+    if _flush_task is None:
+        _flush_task = asyncio.create_task(flush_pending_updates())
 
-def on_file_change(event_type: str, step: Step | None) -> None:
-    """Callback for file changes that schedules async broadcast.
 
-    This callback is called from the watchdog thread, so it schedules
-    the async broadcast operation on the main event loop.
+async def flush_pending_updates() -> None:
+    """Broadcast all pending step updates after the coalescing delay.
 
-    Args:
-        event_type: Type of event ('created', 'modified', 'deleted').
-        step: The updated Step object, or None for deletions.
+    A single pending update is sent as-is; several are wrapped in one
+    batch message so that clients receive them in a single frame. The
+    message is serialized once here and the same text goes to every client.
     """
-    global main_event_loop
+    global _flush_task
+
+    try:
+        await asyncio.sleep(BROADCAST_COALESCE_DELAY)
+    finally:
+        # Also when cancelled at shutdown, so a later server in the same
+        # process can schedule flushes again
+        _flush_task = None
 
-    logger.info("File change detected: %s, step: %s", event_type, step.task_id if step else None)
+    updates = list(_pending_updates.values())
+    _pending_updates.clear()
 
-    if main_event_loop is not None and main_event_loop.is_running():
-        asyncio.run_coroutine_threadsafe(
-            handle_step_update(event_type, step), main_event_loop
-        )
+    if not updates:
+        return
+
+    if len(updates) == 1:
+        message = updates[0]
     else:
-        logger.warning("Event loop not available for broadcasting update")
+        logger.info("Broadcasting batch of %d step updates", len(updates))
+        message = {"type": "batch", "updates": updates}
+    await connection_manager.broadcast_text(orjson.dumps(message).decode())
 
 
 @asynccontextmanager
@@ -122,10 +208,12 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     Yields:
         None during the application lifetime.
     """
-    global step_service, main_event_loop
+    global step_service, _init_payload, _flush_task
 
-    # Store the event loop for use in the file watcher callback
-    main_event_loop = asyncio.get_running_loop()
+    # Drop state left over from a previous run in the same process
+    _init_payload = None
+    _pending_updates.clear()
+    _flush_task = None
 
     steps_folder = get_steps_folder_path()
     logger.info("Starting nwwatch with steps folder: %s", steps_folder)
@@ -137,16 +225,17 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     # Create and start the step service
     step_service = create_step_service(steps_folder)
-    step_service.start_watching(on_file_change)
+    step_service.start_watching(handle_step_update)
     logger.info("File watcher started")
 
     yield
 
-    # Shutdown: stop the file watcher
+    # Shutdown: stop the file watcher and drop unsent updates
     if step_service is not None:
         step_service.stop_watching()
         logger.info("File watcher stopped")
-    main_event_loop = None
+    if _flush_task is not None:
+        _flush_task.cancel()
 
 
 # Create FastAPI application
@@ -192,13 +281,10 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
     try:
         # Send init message with all steps
         if step_service is not None:
-            steps = step_service.get_all_steps()
-            init_message = {
-                "type": "init",
-                "steps": [step.to_dict() for step in steps],
-            }
-            await connection_manager.send_personal(websocket, init_message)
-            logger.info("Sent init message with %d steps", len(steps))
+            await connection_manager.send_personal_text(
+                websocket, get_init_payload(step_service)
+            )
+            logger.info("Sent init message")
 
         # Keep connection open and handle incoming messages
         while True:
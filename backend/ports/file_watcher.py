@@ -7,6 +7,9 @@ from typing import Callable, Protocol
 
 from domain.events import FileEvent
 
+# Type alias for the callback receiving a batch of coalesced file events
+FileEventBatchCallback = Callable[[list[FileEvent]], None]
+
 
 class FileWatcher(Protocol):
     """Protocol defining the interface for file system monitoring.
@@ -16,18 +19,20 @@ class FileWatcher(Protocol):
     on concrete implementations.
 
     The watcher monitors a folder for file changes and invokes a callback
-    when changes are detected.
+    when changes are detected. Changes that arrive close together are
+    delivered together, so consumers can process a burst in one pass.
     """
 
-    def start(self, callback: Callable[[FileEvent], None]) -> None:
+    def start(self, callback: FileEventBatchCallback) -> None:
         """Start watching for file changes.
 
         Begins monitoring the configured folder for file system events.
-        When a change is detected, the callback is invoked with a FileEvent.
+        When changes are detected, the callback is invoked with a batch of
+        FileEvents.
 
         Args:
-            callback: Function to call when a file change is detected.
-                     Receives a FileEvent object as its only argument.
+            callback: Function to call when file changes are detected.
+                     Receives a non-empty list of FileEvent objects.
         """
         ...
 
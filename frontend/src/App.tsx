@@ -9,9 +9,15 @@ import { ConnectionStatus } from './components/ConnectionStatus';
 import { StepGrid } from './components/StepGrid';
 
 /**
- * WebSocket URL - reads from environment or defaults to localhost.
+ * WebSocket URL - reads from environment, otherwise uses localhost:8000 in
+ * development and the serving host (the backend itself) in production builds,
+ * over wss when the page was loaded over https.
  */
-const WS_URL = import.meta.env.VITE_WS_URL || 'ws://localhost:8000/ws';
+const WS_URL =
+  import.meta.env.VITE_WS_URL ||
+  (import.meta.env.DEV
+    ? 'ws://localhost:8000/ws'
+    : `${window.location.protocol === 'https:' ? 'wss' : 'ws'}://${window.location.host}/ws`);
 
 /**
  * Extend Window interface for testing purposes.
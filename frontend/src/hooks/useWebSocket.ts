@@ -1,10 +1,13 @@
 import { useState, useEffect, useRef, useCallback } from 'react';
 import {
   Step,
+  UpdateMessage,
+  RemoveMessage,
   WebSocketMessage,
   isInitMessage,
   isUpdateMessage,
   isRemoveMessage,
+  isBatchMessage,
 } from '../types/step';
 
 /**
@@ -29,6 +32,30 @@ const RECONNECT_CONFIG = {
   multiplier: 2,
 };
 
+/**
+ * Applies a single update or remove message to a steps array.
+ *
+ * @param steps - Current steps array
+ * @param message - Update or remove message to apply
+ * @returns New steps array with the change applied
+ */
+function applyStepChange(steps: Step[], message: UpdateMessage | RemoveMessage): Step[] {
+  if (isRemoveMessage(message)) {
+    return steps.filter((s) => s.taskId !== message.taskId);
+  }
+
+  const existingIndex = steps.findIndex((s) => s.taskId === message.step.taskId);
+  if (existingIndex >= 0) {
+    // Update existing step
+    const newSteps = [...steps];
+    newSteps[existingIndex] = message.step;
+    return newSteps;
+  }
+
+  // Add new step
+  return [...steps, message.step];
+}
+
 /**
  * Custom hook for WebSocket connection and state management.
  * Handles real-time step updates with automatic reconnection.
@@ -100,29 +127,15 @@ export function useWebSocket(url: string): UseWebSocketResult {
       } else if (isUpdateMessage(message)) {
         // Update or add a single step
         console.log('Update: step', message.step.taskId, 'status:', message.step.status);
-        setSteps((prevSteps) => {
-          const existingIndex = prevSteps.findIndex(
-            (s) => s.taskId === message.step.taskId
-          );
-
-          if (existingIndex >= 0) {
-            // Update existing step
-            const newSteps = [...prevSteps];
-            newSteps[existingIndex] = message.step;
-            console.log('Updated existing step at index', existingIndex);
-            return newSteps;
-          } else {
-            // Add new step
-            console.log('Added new step');
-            return [...prevSteps, message.step];
-          }
-        });
+        setSteps((prevSteps) => applyStepChange(prevSteps, message));
       } else if (isRemoveMessage(message)) {
         // Remove step from list
         console.log('Remove: step', message.taskId);
-        setSteps((prevSteps) =>
-          prevSteps.filter((s) => s.taskId !== message.taskId)
-        );
+        setSteps((prevSteps) => applyStepChange(prevSteps, message));
+      } else if (isBatchMessage(message)) {
+        // Apply several coalesced changes in a single state update
+        console.log('Batch:', message.updates.length, 'changes');
+        setSteps((prevSteps) => message.updates.reduce(applyStepChange, prevSteps));
       }
     } catch (error) {
       console.error('Failed to parse WebSocket message:', error);
@@ -20,7 +20,7 @@ export interface Step {
 /**
  * WebSocket message types for real-time step updates.
  */
-export type WebSocketMessageType = 'init' | 'update' | 'remove';
+export type WebSocketMessageType = 'init' | 'update' | 'remove' | 'batch';
 
 /**
  * Base WebSocket message structure.
@@ -55,10 +55,19 @@ export interface RemoveMessage extends BaseWebSocketMessage {
   projectId: string;
 }
 
+/**
+ * BatchMessage carries several coalesced update and remove messages.
+ * The updates are applied in order.
+ */
+export interface BatchMessage extends BaseWebSocketMessage {
+  type: 'batch';
+  updates: (UpdateMessage | RemoveMessage)[];
+}
+
 /**
  * Union type for all WebSocket messages.
  */
-export type WebSocketMessage = InitMessage | UpdateMessage | RemoveMessage;
+export type WebSocketMessage = InitMessage | UpdateMessage | RemoveMessage | BatchMessage;
 
 /**
  * Type guard to check if a message is an InitMessage.
@@ -80,3 +89,10 @@ export function isUpdateMessage(message: WebSocketMessage): message is UpdateMes
 export function isRemoveMessage(message: WebSocketMessage): message is RemoveMessage {
   return message.type === 'remove';
 }
+
+/**
+ * Type guard to check if a message is a BatchMessage.
+ */
+export function isBatchMessage(message: WebSocketMessage): message is BatchMessage {
+  return message.type === 'batch';
+}
@@ -9,12 +9,26 @@ Provides test infrastructure for E2E testing with:
 
 import pytest
 import tempfile
-import subprocess
+import threading
 import time
-import json
-import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
+import orjson
+import uvicorn
+
+# Backend modules import each other as top-level packages (adapters, domain, ...)
+BACKEND_DIR = Path(__file__).parent.parent.parent / "backend"
+sys.path.insert(0, str(BACKEND_DIR))
+
+# Seconds to wait for the in-process backend server to start or stop
+SERVER_TIMEOUT = 5
+
+# Number of threads used to seed step files in bulk
+MAX_WRITE_WORKERS = 8
+
 # Playwright imports (installed via pytest-playwright)
 pytest_plugins = ["pytest_bdd"]
 
@@ -27,48 +41,51 @@ def steps_folder():
     Yields the folder path and cleans up after test.
     """
     with tempfile.TemporaryDirectory(prefix="nwwatch_test_") as tmpdir:
-        yield tmpdir
+        yield Path(tmpdir)
+
+
+@pytest.fixture(scope="function")
+def steps(steps_folder):
+    """
+    Provide a StepFolder helper bound to the test steps folder.
+
+    Lets step definitions manipulate step files without passing
+    the folder path on every call.
+    """
+    return StepFolder(steps_folder)
 
 
 @pytest.fixture(scope="function")
-def backend_server(steps_folder):
+def backend_server(steps_folder, monkeypatch):
     """
     Start the nwwatch backend server pointing to the test steps folder.
 
+    Runs the ASGI app in-process on a background thread, bound to an
+    ephemeral port, so each test avoids a fresh interpreter start-up.
     Waits for server to be ready before yielding.
-    Terminates server after test completes.
-    """
-    backend_path = Path(__file__).parent.parent.parent / "backend" / "main.py"
-
-    process = subprocess.Popen(
-        ["python", str(backend_path), steps_folder],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        env={**os.environ, "PYTHONUNBUFFERED": "1"}
-    )
-
-    # Wait for server to start (check if port 8000 is listening)
-    max_wait = 5
-    start_time = time.time()
-    while time.time() - start_time < max_wait:
-        try:
-            import socket
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            result = sock.connect_ex(('localhost', 8000))
-            sock.close()
-            if result == 0:
-                break
-        except Exception:
-            pass
-        time.sleep(0.1)
-
-    yield process
-
-    process.terminate()
-    try:
-        process.wait(timeout=5)
-    except subprocess.TimeoutExpired:
-        process.kill()
+    Stops server after test completes.
+    """
+    # The app reads the steps folder from the command line on startup
+    monkeypatch.setattr(sys, "argv", ["main.py", str(steps_folder)])
+    from main import app
+
+    config = uvicorn.Config(app, host="127.0.0.1", port=0, log_level="warning")
+    server = uvicorn.Server(config)
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+
+    deadline = time.monotonic() + SERVER_TIMEOUT
+    while not server.started:
+        if not thread.is_alive() or time.monotonic() > deadline:
+            pytest.fail("Backend server failed to start")
+        time.sleep(0.01)
+
+    port = server.servers[0].sockets[0].getsockname()[1]
+
+    yield BackendServer(server, thread, f"http://localhost:{port}")
+
+    server.should_exit = True
+    thread.join(SERVER_TIMEOUT)
 
 
 @pytest.fixture(scope="function")
@@ -79,7 +96,7 @@ def browser_page(page, backend_server):
     Uses Playwright's page fixture (from pytest-playwright).
     Waits for the step grid to be visible before returning.
     """
-    page.goto("http://localhost:8000")
+    page.goto(backend_server.base_url)
 
     # Wait for the app to load
     page.wait_for_selector("[data-testid='step-grid']", timeout=5000)
@@ -91,8 +108,8 @@ def browser_page(page, backend_server):
 # Helper functions for step definitions
 # ============================================================================
 
-def create_step_file(folder: str, task_id: str, project_id: str,
-                     phase: str, status: str, description: str = None):
+def create_step_file(folder: Path, task_id: str, project_id: str,
+                     phase: str, status: str, description: str = None) -> Path:
     """
     Create a step JSON file in the given folder.
 
@@ -103,8 +120,48 @@ def create_step_file(folder: str, task_id: str, project_id: str,
         phase: Phase name
         status: Step status (pending, in_progress, completed, failed, skipped)
         description: Optional description (defaults to auto-generated)
+
+    Returns:
+        Path to the created step file
+    """
+    file_path = folder / f"{task_id}.json"
+    file_path.write_bytes(orjson.dumps(
+        _step_data(task_id, project_id, phase, status, description),
+        option=orjson.OPT_INDENT_2
+    ))
+
+    return file_path
+
+
+def bulk_create_steps(folder: Path, defs: list[dict]) -> list[Path]:
+    """
+    Create many step JSON files at once, writing them concurrently.
+
+    Args:
+        folder: Path to the steps folder
+        defs: Step definitions, each with the keyword arguments of
+            create_step_file (task_id, project_id, phase, status and
+            optionally description)
+
+    Returns:
+        Paths to the created step files
     """
-    step_data = {
+    if not defs:
+        return []
+
+    def write(step_def: dict) -> Path:
+        file_path = folder / f"{step_def['task_id']}.json"
+        file_path.write_bytes(orjson.dumps(_step_data(**step_def), option=orjson.OPT_INDENT_2))
+        return file_path
+
+    with ThreadPoolExecutor(max_workers=min(MAX_WRITE_WORKERS, len(defs))) as executor:
+        return list(executor.map(write, defs))
+
+
+def _step_data(task_id: str, project_id: str, phase: str,
+               status: str, description: str = None) -> dict:
+    """Build the JSON content of a step file."""
+    return {
         "task_id": task_id,
         "project_id": project_id,
         "phase": phase,
@@ -114,14 +171,8 @@ def create_step_file(folder: str, task_id: str, project_id: str,
         }
     }
 
-    file_path = os.path.join(folder, f"{task_id}.json")
-    with open(file_path, 'w') as f:
-        json.dump(step_data, f, indent=2)
-
-    return file_path
-
 
-def modify_step_status(folder: str, task_id: str, new_status: str):
+def modify_step_status(folder: Path, task_id: str, new_status: str):
     """
     Modify the status of an existing step file.
 
@@ -130,18 +181,15 @@ def modify_step_status(folder: str, task_id: str, new_status: str):
         task_id: Step task ID (e.g., "01-01")
         new_status: New status value
     """
-    file_path = os.path.join(folder, f"{task_id}.json")
-
-    with open(file_path, 'r') as f:
-        data = json.load(f)
+    file_path = folder / f"{task_id}.json"
 
+    data = orjson.loads(file_path.read_bytes())
     data["validation"]["status"] = new_status
 
-    with open(file_path, 'w') as f:
-        json.dump(data, f, indent=2)
+    file_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
 
 
-def delete_step_file(folder: str, task_id: str):
+def delete_step_file(folder: Path, task_id: str):
     """
     Delete a step file from the folder.
 
@@ -149,11 +197,10 @@ def delete_step_file(folder: str, task_id: str):
         folder: Path to the steps folder
         task_id: Step task ID (e.g., "01-01")
     """
-    file_path = os.path.join(folder, f"{task_id}.json")
-    os.remove(file_path)
+    (folder / f"{task_id}.json").unlink()
 
 
-def create_malformed_json(folder: str, filename: str):
+def create_malformed_json(folder: Path, filename: str):
     """
     Create a malformed JSON file for error handling tests.
 
@@ -161,9 +208,66 @@ def create_malformed_json(folder: str, filename: str):
         folder: Path to the steps folder
         filename: Name of the file to create
     """
-    file_path = os.path.join(folder, filename)
-    with open(file_path, 'w') as f:
-        f.write('{ "task_id": "bad", invalid json here }')
+    (folder / filename).write_bytes(b'{ "task_id": "bad", invalid json here }')
+
+
+@dataclass
+class BackendServer:
+    """
+    Handle on the in-process backend server started by backend_server.
+
+    Attributes:
+        server: The uvicorn server serving the app
+        thread: Background thread running the server
+        base_url: URL the server is reachable at (ephemeral port)
+    """
+
+    server: uvicorn.Server
+    thread: threading.Thread
+    base_url: str
+
+    @property
+    def is_running(self) -> bool:
+        """Return True while the server thread is alive and not stopping."""
+        return self.thread.is_alive() and not self.server.should_exit
+
+
+class StepFolder:
+    """
+    Step file helpers bound to a single steps folder.
+
+    Wraps the module-level helpers so step definitions can call
+    steps.create("01-01", "proj", "design", "pending") directly.
+    """
+
+    def __init__(self, folder: Path):
+        self.folder = folder
+
+    def create(self, task_id: str, project_id: str, phase: str,
+               status: str, description: str = None) -> Path:
+        """Create a step file. See create_step_file."""
+        return create_step_file(self.folder, task_id, project_id,
+                                phase, status, description)
+
+    def create_many(self, defs: list[dict]) -> list[Path]:
+        """Create many step files concurrently. See bulk_create_steps."""
+        return bulk_create_steps(self.folder, defs)
+
+    def modify_status(self, task_id: str, new_status: str):
+        """Change a step's status. See modify_step_status."""
+        modify_step_status(self.folder, task_id, new_status)
+
+    def delete(self, task_id: str):
+        """Delete a step file. See delete_step_file."""
+        delete_step_file(self.folder, task_id)
+
+    def create_malformed(self, filename: str):
+        """Create a malformed JSON file. See create_malformed_json."""
+        create_malformed_json(self.folder, filename)
+
+    def is_empty(self) -> bool:
+        """Return True if the folder contains no files."""
+        return next(self.folder.iterdir(), None) is None
 
 
 # ============================================================================
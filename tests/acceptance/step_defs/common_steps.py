@@ -9,17 +9,8 @@ Provides reusable Given/When/Then steps for:
 
 from pytest_bdd import given, when, then, parsers
 from playwright.sync_api import expect
-import json
-import os
 import time
 
-from tests.acceptance.conftest import (
-    create_step_file,
-    modify_step_status,
-    delete_step_file,
-    create_malformed_json
-)
-
 
 # ============================================================================
 # GIVEN Steps
@@ -28,7 +19,7 @@ from tests.acceptance.conftest import (
 @given("the nwwatch backend is running")
 def given_backend_running(backend_server):
     """Ensure backend is running via fixture."""
-    assert backend_server.poll() is None, "Backend server crashed"
+    assert backend_server.is_running, "Backend server crashed"
 
 
 @given("the browser is connected to the step viewer")
@@ -39,7 +30,7 @@ def given_browser_connected(browser_page):
 
 
 @given(parsers.parse("the steps folder contains the following step files:"))
-def given_step_files(steps_folder, datatable):
+def given_step_files(steps, datatable):
     """
     Create step files from a Gherkin datatable.
 
@@ -47,21 +38,21 @@ def given_step_files(steps_folder, datatable):
     | task_id | project_id | phase      | status    |
     | 01-01   | my-project | Foundation | completed |
     """
-    for row in datatable:
-        create_step_file(
-            folder=steps_folder,
-            task_id=row["task_id"],
-            project_id=row["project_id"],
-            phase=row["phase"],
-            status=row["status"]
-        )
+    steps.create_many([
+        {
+            "task_id": row["task_id"],
+            "project_id": row["project_id"],
+            "phase": row["phase"],
+            "status": row["status"],
+        }
+        for row in datatable
+    ])
 
 
 @given(parsers.parse('the steps folder contains a step with status "{status}"'))
-def given_single_step_with_status(steps_folder, status):
+def given_single_step_with_status(steps, status):
     """Create a single step with the specified status."""
-    create_step_file(
-        folder=steps_folder,
+    steps.create(
         task_id="01-01",
         project_id="test-project",
         phase="TestPhase",
@@ -70,31 +61,31 @@ def given_single_step_with_status(steps_folder, status):
 
 
 @given(parsers.parse('the steps folder contains a malformed JSON file "{filename}"'))
-def given_malformed_json(steps_folder, filename):
+def given_malformed_json(steps, filename):
     """Create a malformed JSON file for error handling tests."""
-    create_malformed_json(steps_folder, filename)
+    steps.create_malformed(filename)
 
 
 @given("the steps folder is empty")
-def given_empty_folder(steps_folder):
+def given_empty_folder(steps):
     """Ensure steps folder is empty (already is from fixture)."""
-    assert len(os.listdir(steps_folder)) == 0
+    assert steps.is_empty()
 
 
 @given(parsers.parse("the steps folder contains {count:d} step files across {phases:d} phases"))
-def given_many_steps(steps_folder, count, phases):
+def given_many_steps(steps, count, phases):
     """Create many step files for performance testing."""
     steps_per_phase = count // phases
-    for phase_num in range(1, phases + 1):
-        for step_num in range(1, steps_per_phase + 1):
-            task_id = f"{phase_num:02d}-{step_num:02d}"
-            create_step_file(
-                folder=steps_folder,
-                task_id=task_id,
-                project_id="test-project",
-                phase=f"Phase{phase_num}",
-                status="pending"
-            )
+    steps.create_many([
+        {
+            "task_id": f"{phase_num:02d}-{step_num:02d}",
+            "project_id": "test-project",
+            "phase": f"Phase{phase_num}",
+            "status": "pending",
+        }
+        for phase_num in range(1, phases + 1)
+        for step_num in range(1, steps_per_phase + 1)
+    ])
 
 
 @given(parsers.parse('the step card "{task_id}" shows status "{status}"'))
@@ -133,18 +124,24 @@ def when_open_viewer(browser_page):
 
 
 @when(parsers.parse('the step file "{filename}" is modified with status "{status}"'))
-def when_modify_step(steps_folder, filename, status):
+def when_modify_step(steps, filename, status):
     """Modify a step file's status."""
     task_id = filename.replace(".json", "")
-    modify_step_status(steps_folder, task_id, status)
+    steps.modify_status(task_id, status)
+
+
+@when(parsers.parse('the step files "{first}" and "{second}" are modified with status "{status}" at the same time'))
+def when_modify_steps_together(steps, first, second, status):
+    """Modify two step files back to back, within one broadcast window."""
+    for filename in (first, second):
+        steps.modify_status(filename.replace(".json", ""), status)
 
 
 @when(parsers.parse('a new step file "{filename}" is created with:'))
-def when_create_step(steps_folder, filename, datatable):
+def when_create_step(steps, filename, datatable):
     """Create a new step file from datatable."""
     row = datatable[0]
-    create_step_file(
-        folder=steps_folder,
+    steps.create(
         task_id=row["task_id"],
         project_id=row["project_id"],
         phase=row["phase"],
@@ -153,10 +150,10 @@ def when_create_step(steps_folder, filename, datatable):
 
 
 @when(parsers.parse('the step file "{filename}" is deleted'))
-def when_delete_step(steps_folder, filename):
+def when_delete_step(steps, filename):
     """Delete a step file."""
     task_id = filename.replace(".json", "")
-    delete_step_file(steps_folder, task_id)
+    steps.delete(task_id)
 
 
 @when("I click the theme toggle button")
@@ -187,12 +184,12 @@ def when_connection_restored(browser_page):
 
 
 @when(parsers.parse('the step file "{filename}" is modified {count:d} times in quick succession'))
-def when_rapid_modifications(steps_folder, filename, count):
+def when_rapid_modifications(steps, filename, count):
     """Rapidly modify a step file multiple times."""
     task_id = filename.replace(".json", "")
     statuses = ["pending", "in_progress", "completed", "failed", "skipped"]
     for i in range(count):
-        modify_step_status(steps_folder, task_id, statuses[i % len(statuses)])
+        steps.modify_status(task_id, statuses[i % len(statuses)])
         time.sleep(0.05)  # 50ms between changes
 
 
@@ -128,6 +128,17 @@ Feature: nWave Step Viewer
     Then within 1 second I should see 1 step card displayed
     And the step card "01-02" should not be visible
 
+  @US-03 @batched-updates
+  Scenario: Simultaneous changes to several steps all appear
+    Given the steps folder contains the following step files:
+      | task_id | project_id | phase      | status  |
+      | 01-01   | my-project | Foundation | pending |
+      | 01-02   | my-project | Foundation | pending |
+    And I open the step viewer
+    When the step files "01-01.json" and "01-02.json" are modified with status "completed" at the same time
+    Then within 1 second the step card "01-01" should show status "completed"
+    And within 1 second the step card "01-02" should show status "completed"
+
   @US-03 @no-refresh-required
   Scenario: Updates appear without page refresh
     Given the steps folder contains the following step files:
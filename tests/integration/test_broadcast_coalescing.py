@@ -0,0 +1,100 @@
+"""
+Integration tests for coalesced step broadcasts in the backend.
+
+Drives handle_step_update directly with in-memory WebSocket stand-ins,
+so the timing of connects, disconnects and updates inside one coalescing
+window is deterministic.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import orjson
+import pytest
+
+# Backend modules import each other as top-level packages (adapters, domain, ...)
+BACKEND_DIR = Path(__file__).parent.parent.parent / "backend"
+sys.path.insert(0, str(BACKEND_DIR))
+
+import main  # noqa: E402
+from application.connection_manager import ConnectionManager  # noqa: E402
+from domain.step import Step  # noqa: E402
+
+
+class FakeWebSocket:
+    """Minimal WebSocket stand-in recording the text frames it is sent."""
+
+    def __init__(self):
+        self.sent = []
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, text: str):
+        self.sent.append(orjson.loads(text))
+
+
+def make_step(status: str) -> Step:
+    """Build step 01-01 with the given status."""
+    return Step.from_dict({
+        "task_id": "01-01",
+        "project_id": "test-project",
+        "phase": "Foundation",
+        "description": "Test step 01-01",
+        "validation": {"status": status},
+    })
+
+
+@pytest.fixture
+def connection_manager(monkeypatch):
+    """Give main a fresh ConnectionManager and clean broadcast state."""
+    manager = ConnectionManager()
+    monkeypatch.setattr(main, "connection_manager", manager)
+    monkeypatch.setattr(main, "_init_payload", None)
+    monkeypatch.setattr(main, "_flush_task", None)
+    main._pending_updates.clear()
+    yield manager
+    main._pending_updates.clear()
+
+
+def test_update_skipped_without_clients_drops_older_queued_updates(connection_manager):
+    """A client connecting mid-window must not receive a stale queued update."""
+
+    async def scenario():
+        first, second = FakeWebSocket(), FakeWebSocket()
+
+        await connection_manager.connect(first)
+        await main.handle_step_update("modified", make_step("in_progress"))
+        connection_manager.disconnect(first)
+
+        await main.handle_step_update("modified", make_step("completed"))
+        await connection_manager.connect(second)
+
+        await asyncio.sleep(main.BROADCAST_COALESCE_DELAY * 3)
+        return first, second
+
+    first, second = asyncio.run(scenario())
+
+    assert first.sent == []
+    assert second.sent == []
+
+
+def test_updates_within_window_are_sent_once_with_latest_state(connection_manager):
+    """Successive updates to one step reach clients as its latest state."""
+
+    async def scenario():
+        client = FakeWebSocket()
+        await connection_manager.connect(client)
+
+        await main.handle_step_update("modified", make_step("in_progress"))
+        await main.handle_step_update("modified", make_step("completed"))
+
+        await asyncio.sleep(main.BROADCAST_COALESCE_DELAY * 3)
+        return client
+
+    client = asyncio.run(scenario())
+
+    assert len(client.sent) == 1
+    assert client.sent[0]["type"] == "update"
+    assert client.sent[0]["step"]["status"] == "completed"